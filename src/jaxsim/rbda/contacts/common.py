@@ -25,10 +25,12 @@ def compute_penetration_data(
     terrain: jaxsim.terrain.Terrain,
 ) -> tuple[jtp.Float, jtp.Float, jtp.Vector]:
     """
-    Compute the penetration data (depth, rate, and terrain normal) of a collidable point.
+    Compute the penetration data (depth, rate, and terrain normal) of collidable points.
 
     Args:
-        p: The position of the collidable point.
+        p:
+            The position of the collidable point, either a single 3D vector or
+            a matrix of stacked positions.
         v:
             The linear velocity of the point (linear component of the mixed 6D velocity
             of the implicit frame `C = (W_p_C, [W])` associated to the point).
@@ -37,21 +39,30 @@ def compute_penetration_data(
     Returns:
         A tuple containing the penetration depth, the penetration velocity,
         and the considered terrain normal.
+
+    Note:
+        The computation broadcasts over stacked positions and velocities, so
+        batches of collidable points can be processed with a single call
+        instead of a vmap of per-point kernels.
     """
 
     # Pre-process the position and the linear velocity of the collidable point.
-    W_ṗ_C = jnp.array(v).squeeze()
-    px, py, pz = jnp.array(p).squeeze()
+    # The inputs have known shapes (3,) or (n_points, 3), so no squeeze of
+    # spurious dimensions is needed.
+    W_ṗ_C = jnp.array(v)
+    W_p_C = jnp.array(p)
+    px, py, pz = W_p_C[..., 0], W_p_C[..., 1], W_p_C[..., 2]
 
     # Compute the terrain normal and the contact depth.
-    n̂ = terrain.normal(x=px, y=py).squeeze()
-    h = jnp.array([0, 0, terrain.height(x=px, y=py) - pz])
+    # The terrain queries broadcast over batched coordinates.
+    n̂ = jnp.broadcast_to(terrain.normal(x=px, y=py), W_p_C.shape)
+    h = terrain.height(x=px, y=py) - pz
 
     # Compute the penetration depth normal to the terrain.
-    δ = jnp.maximum(0.0, jnp.dot(h, n̂))
+    δ = jnp.maximum(0.0, h * n̂[..., 2])
 
     # Compute the penetration normal velocity.
-    δ_dot = -jnp.dot(W_ṗ_C, n̂)
+    δ_dot = -jnp.sum(W_ṗ_C * n̂, axis=-1)
 
     # Enforce the penetration rate to be zero when the penetration depth is zero.
     δ_dot = jnp.where(δ > 0, δ_dot, 0.0)
@@ -1,18 +1,15 @@
 from __future__ import annotations
 
 import dataclasses
-from collections.abc import Callable
 from typing import Any
 
 import jax
 import jax.numpy as jnp
 import jax_dataclasses
-import optax
 
 import jaxsim.api as js
-import jaxsim.rbda.contacts
 import jaxsim.typing as jtp
-from jaxsim.api.common import ModelDataWithVelocityRepresentation, VelRepr
+from jaxsim.api.common import VelRepr
 
 from . import common
 
@@ -22,6 +19,43 @@ except ImportError:
     from typing_extensions import Self
 
 
+def _inv3x3(M: jtp.MatrixLike) -> jtp.Matrix:
+    """
+    Invert a 3x3 matrix with the closed-form adjugate formula.
+
+    Args:
+        M: The 3x3 matrix to invert.
+
+    Returns:
+        The inverse of the matrix.
+
+    Note:
+        This avoids the general LU-based path of `jnp.linalg.inv`, which has
+        a much higher constant cost for the small inertia blocks handled by
+        the relaxed rigid contact model.
+    """
+
+    m00, m01, m02 = M[0, 0], M[0, 1], M[0, 2]
+    m10, m11, m12 = M[1, 0], M[1, 1], M[1, 2]
+    m20, m21, m22 = M[2, 0], M[2, 1], M[2, 2]
+
+    # Entries of the adjugate matrix (transposed cofactors).
+    a00 = m11 * m22 - m12 * m21
+    a01 = m02 * m21 - m01 * m22
+    a02 = m01 * m12 - m02 * m11
+    a10 = m12 * m20 - m10 * m22
+    a11 = m00 * m22 - m02 * m20
+    a12 = m02 * m10 - m00 * m12
+    a20 = m10 * m21 - m11 * m20
+    a21 = m01 * m20 - m00 * m21
+    a22 = m00 * m11 - m01 * m10
+
+    # Expand the determinant along the first row.
+    det = m00 * a00 + m01 * a10 + m02 * a20
+
+    return jnp.array([[a00, a01, a02], [a10, a11, a12], [a20, a21, a22]]) / det
+
+
 @jax_dataclasses.pytree_dataclass
 class RelaxedRigidContactsParams(common.ContactsParams):
     """Parameters of the relaxed rigid contacts model."""
@@ -79,7 +113,13 @@ class RelaxedRigidContactsParams(common.ContactsParams):
     def __hash__(self) -> int:
         from jaxsim.utils.wrappers import HashedNumpyArray
 
-        return hash(
+        # The parameters are functionally immutable, therefore the hash is
+        # computed lazily on the first access and then cached, avoiding the
+        # per-field walk whenever the pytree is used e.g. as dict key.
+        if (cached_hash := getattr(self, "_cached_hash", None)) is not None:
+            return cached_hash
+
+        value = hash(
             (
                 HashedNumpyArray(self.time_constant),
                 HashedNumpyArray(self.damping_coefficient),
@@ -94,6 +134,11 @@ class RelaxedRigidContactsParams(common.ContactsParams):
             )
         )
 
+        # Bypass the frozen dataclass to store the cached value.
+        object.__setattr__(self, "_cached_hash", value)
+
+        return value
+
     def __eq__(self, other: RelaxedRigidContactsParams) -> bool:
         return hash(self) == hash(other)
 
@@ -162,16 +207,27 @@ class RelaxedRigidContactsParams(common.ContactsParams):
     def valid(self) -> jtp.BoolLike:
         """Check if the parameters are valid."""
 
-        return bool(
-            jnp.all(self.time_constant >= 0.0)
-            and jnp.all(self.damping_coefficient > 0.0)
-            and jnp.all(self.d_min >= 0.0)
-            and jnp.all(self.d_max <= 1.0)
-            and jnp.all(self.d_min <= self.d_max)
-            and jnp.all(self.width >= 0.0)
-            and jnp.all(self.midpoint >= 0.0)
-            and jnp.all(self.power >= 0.0)
-            and jnp.all(self.mu >= 0.0)
+        # The parameters are scalar arrays, so the comparisons can run on
+        # plain Python floats without launching any device reduction.
+        time_constant = float(self.time_constant)
+        damping_coefficient = float(self.damping_coefficient)
+        d_min = float(self.d_min)
+        d_max = float(self.d_max)
+        width = float(self.width)
+        midpoint = float(self.midpoint)
+        power = float(self.power)
+        mu = float(self.mu)
+
+        return (
+            time_constant >= 0.0
+            and damping_coefficient > 0.0
+            and d_min >= 0.0
+            and d_max <= 1.0
+            and d_min <= d_max
+            and width >= 0.0
+            and midpoint >= 0.0
+            and power >= 0.0
+            and mu >= 0.0
         )
 
 
@@ -186,6 +242,13 @@ class RelaxedRigidContacts(common.ContactModel):
         default=(1e-6, 50, 10), kw_only=True
     )
 
+    # Run the Cholesky solve of the contact problem in single precision.
+    # Contact forces rarely need f64 accuracy for simulation purposes, and on
+    # GPU the f32 factorization halves both memory bandwidth and flops.
+    solve_in_float32: jax_dataclasses.Static[bool] = dataclasses.field(
+        default=False, kw_only=True
+    )
+
     @property
     def solver_options(self) -> dict[str, Any]:
         """Get the solver options."""
@@ -208,7 +271,9 @@ class RelaxedRigidContacts(common.ContactModel):
         Create a `RelaxedRigidContacts` instance with specified parameters.
 
         Args:
-            solver_options: The options to pass to the L-BFGS solver.
+            solver_options:
+                Deprecated options of the legacy L-BFGS solver, accepted for
+                backward compatibility and no longer used by the direct solver.
             **kwargs: The parameters of the relaxed rigid contacts model.
 
         Returns:
@@ -241,6 +306,10 @@ class RelaxedRigidContacts(common.ContactModel):
             **kwargs,
         )
 
+    # No static_argnames are needed here: the compile-time invariants of the
+    # model (terrain, contact model, solver options) are Static fields of the
+    # corresponding pytree dataclasses, so jit already keys the compilation
+    # cache on them and traces only the numerical leaves.
     @jax.jit
     def compute_contact_forces(
         self,
@@ -293,10 +362,13 @@ class RelaxedRigidContacts(common.ContactModel):
         )
 
         # Compute the penetration depth and velocity of the collidable points.
-        # Note that this function considers the penetration in the normal direction.
-        δ, _, n̂ = jax.vmap(common.compute_penetration_data, in_axes=(0, 0, None))(
-            position, velocity, model.terrain
-        )
+        # Note that this function considers the penetration in the normal direction,
+        # and broadcasts directly over the stacked points without a vmap.
+        δ, _, n̂ = common.compute_penetration_data(position, velocity, model.terrain)
+
+        # Compute the mask of the collidable points in contact, shared by the
+        # jacobian assembly and the regularizers below.
+        contact_mask = δ > 0
 
         # Compute the position in the constraint frame.
         position_constraint = jax.vmap(lambda δ, n̂: -δ * n̂)(δ, n̂)
@@ -325,16 +397,28 @@ class RelaxedRigidContacts(common.ContactModel):
 
             M = js.model.free_floating_mass_matrix(model=model, data=data)
 
-            Jl_WC = jnp.vstack(
-                jax.vmap(lambda J, δ: J * (δ > 0))(
-                    js.contact.jacobian(model=model, data=data)[:, :3, :], δ
-                )
+            # Mask out the jacobian rows of the collidable points not in contact.
+            Jl_C = js.contact.jacobian(model=model, data=data)[:, :3, :]
+            Jl_WC = (Jl_C * contact_mask[:, jnp.newaxis, jnp.newaxis]).reshape(
+                -1, Jl_C.shape[-1]
             )
 
-            J̇_WC = jnp.vstack(
-                jax.vmap(lambda J̇, δ: J̇ * (δ > 0))(
-                    js.contact.jacobian_derivative(model=model, data=data)[:, :3], δ
-                ),
+            # The jacobian derivative contributes only through the bias term
+            # J̇_WC @ BW_ν and requires expensive second-order kinematics.
+            # Skip its computation at runtime when no point is in contact.
+            def compute_J̇ν() -> jtp.Vector:
+
+                J̇l_C = js.contact.jacobian_derivative(model=model, data=data)[:, :3]
+                J̇_WC = (J̇l_C * contact_mask[:, jnp.newaxis, jnp.newaxis]).reshape(
+                    -1, J̇l_C.shape[-1]
+                )
+
+                return J̇_WC @ BW_ν
+
+            J̇ν = jax.lax.cond(
+                pred=jnp.any(contact_mask),
+                true_fun=compute_J̇ν,
+                false_fun=lambda: jnp.zeros_like(Jl_WC[:, 0]),
             )
 
         # Compute the regularization terms.
@@ -343,136 +427,102 @@ class RelaxedRigidContacts(common.ContactModel):
             position_constraint=position_constraint,
             velocity_constraint=velocity,
             parameters=data.contacts_params,
+            contact_mask=contact_mask,
         )
 
         # Compute the Delassus matrix and the free mixed linear acceleration of
-        # the collidable points.
-        G = Jl_WC @ jnp.linalg.pinv(M) @ Jl_WC.T
-        CW_al_free_WC = Jl_WC @ BW_ν̇_free + J̇_WC @ BW_ν
+        # the collidable points. The mass matrix is symmetric positive definite,
+        # so a Cholesky solve replaces the SVD-based pseudo-inverse.
+        G = Jl_WC @ jax.scipy.linalg.cho_solve(jax.scipy.linalg.cho_factor(M), Jl_WC.T)
+        CW_al_free_WC = Jl_WC @ BW_ν̇_free + J̇ν
 
         # Calculate quantities for the linear optimization problem.
-        A = G + R
+        # R stores only the diagonal of the regularization matrix, added here
+        # in place without materializing a dense diagonal matrix.
+        A = G.at[jnp.diag_indices_from(G)].add(R)
         b = CW_al_free_WC - a_ref
 
-        # Create the objective function to minimize as a lambda computing the cost
-        # from the optimized variables x.
-        objective = lambda x, A, b: jnp.sum(jnp.square(A @ x + b))
-
-        # ========================================
-        # Helper function to run the L-BFGS solver
-        # ========================================
-
-        def run_optimization(
-            init_params: jtp.Vector,
-            fun: Callable,
-            opt: optax.GradientTransformationExtraArgs,
-            maxiter: int,
-            tol: float,
-        ) -> tuple[jtp.Vector, optax.OptState]:
+        # The relaxed-rigid problem minimizes the convex quadratic ‖A x + b‖²
+        # with A = G + R symmetric positive semi-definite, so its minimizer is
+        # the solution of the linear system A x = -b.
 
-            # Get the function to compute the loss and the gradient w.r.t. its inputs.
-            value_and_grad_fn = optax.value_and_grad_from_state(fun)
+        def solve(A: jtp.Matrix, b: jtp.Vector) -> jtp.Vector:
 
-            # Initialize the carry of the following loop.
-            OptimizationCarry = tuple[jtp.Vector, optax.OptState]
-            init_carry: OptimizationCarry = (init_params, opt.init(params=init_params))
+            # Shift the diagonal to make A positive definite when the rows of
+            # inactive collidable points (or a zero regularizer, e.g. mu=0)
+            # leave it singular. The shift is scaled to the solve precision and
+            # to the magnitude of A so that it stays above the rounding error
+            # of the factorization in both double and single precision.
+            shift = jnp.finfo(A.dtype).eps * jnp.maximum(jnp.trace(A), 1.0)
+            A = A.at[jnp.diag_indices_from(A)].add(shift)
 
-            def step(carry: OptimizationCarry) -> OptimizationCarry:
+            return jax.scipy.linalg.cho_solve(jax.scipy.linalg.cho_factor(A), -b)
 
-                params, state = carry
+        # Optionally demote the solve to single precision. The flag is static,
+        # so only the selected branch is traced.
+        if self.solve_in_float32:
+            solution = solve(A.astype(jnp.float32), b.astype(jnp.float32))
+            solution = solution.astype(b.dtype)
+        else:
+            solution = solve(A, b)
 
-                value, grad = value_and_grad_fn(
-                    params,
-                    state=state,
-                    A=A,
-                    b=b,
-                )
-
-                updates, state = opt.update(
-                    updates=grad,
-                    state=state,
-                    params=params,
-                    value=value,
-                    grad=grad,
-                    value_fn=fun,
-                    A=A,
-                    b=b,
-                )
-
-                params = optax.apply_updates(params, updates)
-
-                return params, state
-
-            # TODO: maybe fix the number of iterations and switch to scan?
-            def continuing_criterion(carry: OptimizationCarry) -> jtp.Bool:
+        # Compute the 3D linear force in C[W] frame and reshape the solution
+        # to be a matrix of 3D contact forces.
+        CW_fl_C = solution.reshape(-1, 3)
 
-                _, state = carry
+        # Convert the contact forces from mixed to inertial-fixed representation.
+        # The mixed frame C[W] shares the world orientation and the solution has
+        # no torque component, so the full 6D force transform reduces to keeping
+        # the linear force and adding the moment arm of the contact position.
+        W_p_C = W_H_C[:, 0:3, 3]
+        W_f_C = jnp.hstack([CW_fl_C, jnp.cross(W_p_C, CW_fl_C)])
 
-                iter_num = optax.tree_utils.tree_get(state, "count")
-                grad = optax.tree_utils.tree_get(state, "grad")
-                err = optax.tree_utils.tree_l2_norm(grad)
+        return W_f_C, {}
 
-                return (iter_num == 0) | ((iter_num < maxiter) & (err >= tol))
+    def compute_contact_forces_batched(
+        self,
+        model: js.model.JaxSimModel,
+        data: js.data.JaxSimModelData,
+        *,
+        link_forces: jtp.ArrayLike | None = None,
+        joint_force_references: jtp.MatrixLike | None = None,
+    ) -> tuple[jtp.Array, dict[str, jtp.PyTree]]:
+        """
+        Compute the contact forces over a batch of model data.
 
-            final_params, final_state = jax.lax.while_loop(
-                continuing_criterion, step, init_carry
-            )
+        Args:
+            model: The model to consider, shared across the batch.
+            data: The data of the considered model, batched over the leading axis.
+            link_forces:
+                Optional `(batch, n_links, 6)` array of external forces acting on
+                the links, expressed in the same representation of data.
+            joint_force_references:
+                Optional `(batch, n_joints)` matrix of joint forces.
 
-            return final_params, final_state
-
-        # ======================================
-        # Compute the contact forces with L-BFGS
-        # ======================================
-
-        # Initialize the optimized forces with a linear Hunt/Crossley model.
-        init_params = jax.vmap(
-            lambda p, v: jaxsim.rbda.contacts.SoftContacts.hunt_crossley_contact_model(
-                position=p,
-                velocity=v,
-                terrain=model.terrain,
-                K=1e6,
-                D=2e3,
-                p=0.5,
-                q=0.5,
-                # No tangential initial forces.
-                mu=0.0,
-                tangential_deformation=jnp.zeros(3),
-            )[0]
-        )(position, velocity).flatten()
-
-        # Get the solver options.
-        solver_options = self.solver_options
-
-        # Extract the options corresponding to the convergence criteria.
-        # All the remaining options are passed to the solver.
-        tol = solver_options.pop("tol")
-        maxiter = solver_options.pop("maxiter")
-
-        # Compute the 3D linear force in C[W] frame.
-        solution, _ = run_optimization(
-            init_params=init_params,
-            fun=objective,
-            opt=optax.lbfgs(**solver_options),
-            tol=tol,
-            maxiter=maxiter,
-        )
+        Returns:
+            A tuple containing as first element the computed contact forces.
 
-        # Reshape the optimized solution to be a matrix of 3D contact forces.
-        CW_fl_C = solution.reshape(-1, 3)
+        Note:
+            Batching e.g. the parallel environments of RL pipelines through this
+            entrypoint lets XLA emit a single batched Cholesky factorization and
+            batched GEMM kernels instead of dispatching many small solves.
+        """
 
-        # Convert the contact forces from mixed to inertial-fixed representation.
-        W_f_C = jax.vmap(
-            lambda CW_fl_C, W_H_C: (
-                ModelDataWithVelocityRepresentation.other_representation_to_inertial(
-                    array=jnp.zeros(6).at[0:3].set(CW_fl_C),
-                    transform=W_H_C,
-                    other_representation=VelRepr.Mixed,
-                    is_force=True,
+        return jax.vmap(
+            lambda data, link_forces, joint_force_references: (
+                self.compute_contact_forces(
+                    model=model,
+                    data=data,
+                    link_forces=link_forces,
+                    joint_force_references=joint_force_references,
                 )
             ),
-        )(CW_fl_C, W_H_C)
-
-        return W_f_C, {}
+            in_axes=(
+                0,
+                0 if link_forces is not None else None,
+                0 if joint_force_references is not None else None,
+            ),
+        )(data, link_forces, joint_force_references)
 
     @staticmethod
     def _regularizers(
@@ -480,6 +530,7 @@ class RelaxedRigidContacts(common.ContactModel):
         position_constraint: jtp.Vector,
         velocity_constraint: jtp.Vector,
         parameters: RelaxedRigidContactsParams,
+        contact_mask: jtp.VectorLike,
     ) -> tuple:
         """
         Compute the contact jacobian and the reference acceleration.
@@ -489,10 +540,11 @@ class RelaxedRigidContacts(common.ContactModel):
             position_constraint: The position of the collidable points in the constraint frame.
             velocity_constraint: The velocity of the collidable points in the constraint frame.
             parameters: The parameters of the relaxed rigid contacts model.
+            contact_mask: The boolean mask of the collidable points in contact.
 
         Returns:
-            A tuple containing the reference acceleration, the regularization matrix,
-            the stiffness, and the damping.
+            A tuple containing the reference acceleration, the diagonal of the
+            regularization matrix, the stiffness, and the damping.
         """
 
         # Extract the parameters of the contact model.
@@ -524,6 +576,28 @@ class RelaxedRigidContacts(common.ContactModel):
         # Compute the 6D inertia matrices of all links.
         M_L = js.model.link_spatial_inertia_matrices(model=model)
 
+        # Invert the 3x3 inertia blocks once per link, so that the vmapped
+        # per-point computation below only gathers them by parent link index
+        # instead of re-inverting the same matrices for each collidable point.
+        M_L_inv = jax.vmap(lambda M: _inv3x3(M[:3, :3]))(M_L)
+
+        # The midpoint power coefficients and the spring-damper parameters do
+        # not depend on the contact state. Compute them once here, outside the
+        # per-point function, so that XLA folds them to constants instead of
+        # re-evaluating the transcendentals for each collidable point.
+        imp_a_coeff = 1.0 / jnp.power(mid, p - 1)
+        imp_b_coeff = 1.0 / jnp.power(1 - mid, p - 1)
+
+        # Compute the spring and damper parameters during runtime from the
+        # impedance and other contact parameters.
+        K = 1 / (ξ_max * Ω * ζ) ** 2
+        D = 2 / (ξ_max * Ω)
+
+        # If the user specifies K and D and they are negative, the computed `a_ref`
+        # becomes something more similar to a classic Baumgarte regularization.
+        K = jnp.where(K < 0, -K / ξ_max**2, K)
+        D = jnp.where(D < 0, -D / ξ_max, D)
+
         def imp_aref(
             pos: jtp.Vector,
             vel: jtp.Vector,
@@ -544,24 +618,16 @@ class RelaxedRigidContacts(common.ContactModel):
 
             imp_x = jnp.abs(pos) / width
 
-            imp_a = (1.0 / jnp.power(mid, p - 1)) * jnp.power(imp_x, p)
-            imp_b = 1 - (1.0 / jnp.power(1 - mid, p - 1)) * jnp.power(1 - imp_x, p)
-            imp_y = jnp.where(imp_x < mid, imp_a, imp_b)
-
-            # Compute the impedance.
-            ξ = ξ_min + imp_y * (ξ_max - ξ_min)
-            ξ = jnp.clip(ξ, ξ_min, ξ_max)
-            ξ = jnp.where(imp_x > 1.0, ξ_max, ξ)
+            imp_a = imp_a_coeff * jnp.power(imp_x, p)
+            imp_b = 1 - imp_b_coeff * jnp.power(1 - imp_x, p)
 
-            # Compute the spring and damper parameters during runtime from the
-            # impedance and other contact parameters.
-            K = 1 / (ξ_max * Ω * ζ) ** 2
-            D = 2 / (ξ_max * Ω)
+            # Saturate the impedance curve at 1 beyond the width, folding the
+            # saturation into the same select so that XLA fuses it in a single
+            # pass instead of patching ξ after the clip.
+            imp_y = jnp.where(imp_x > 1.0, 1.0, jnp.where(imp_x < mid, imp_a, imp_b))
 
-            # If the user specifies K and D and they are negative, the computed `a_ref`
-            # becomes something more similar to a classic Baumgarte regularization.
-            K = jnp.where(K < 0, -K / ξ_max**2, K)
-            D = jnp.where(D < 0, -D / ξ_max, D)
+            # Compute the impedance. A saturated imp_y already maps to ξ_max.
+            ξ = jnp.clip(ξ_min + imp_y * (ξ_max - ξ_min), ξ_min, ξ_max)
 
             # Compute the reference acceleration.
             a_ref = -(D * vel + K * ξ * pos)
@@ -573,33 +639,29 @@ class RelaxedRigidContacts(common.ContactModel):
             link_idx: jtp.Int,
             pos: jtp.Vector,
             vel: jtp.Vector,
+            active: jtp.Bool,
         ) -> tuple[jtp.Vector, jtp.Matrix, jtp.Vector, jtp.Vector]:
 
             # Compute the reference acceleration.
             ξ, a_ref, K, D = imp_aref(pos=pos, vel=vel)
 
             # Compute the regularization term.
-            R = (
-                (2 * μ**2 * (1 - ξ) / (ξ + 1e-12))
-                * (1 + μ**2)
-                @ jnp.linalg.inv(M_L[link_idx, :3, :3])
-            )
+            R = (2 * μ**2 * (1 - ξ) / (ξ + 1e-12)) * (1 + μ**2) @ M_L_inv[link_idx]
 
-            # Return the computed values, setting them to zero in case of no contact.
-            is_active = (pos.dot(pos) > 0).astype(float)
+            # Return the computed values, setting them to zero in case of no
+            # contact by reusing the mask computed from the penetration data.
+            is_active = active.astype(float)
             return jax.tree.map(
                 lambda x: jnp.atleast_1d(x) * is_active, (a_ref, R, K, D)
             )
 
-        a_ref, R, K, D = jax.tree.map(
-            f=jnp.concatenate,
-            tree=(
-                *jax.vmap(compute_row)(
-                    link_idx=parent_link_idx_of_enabled_collidable_points,
-                    pos=position_constraint,
-                    vel=velocity_constraint,
-                ),
-            ),
+        a_ref, R, K, D = jax.vmap(compute_row)(
+            link_idx=parent_link_idx_of_enabled_collidable_points,
+            pos=position_constraint,
+            vel=velocity_constraint,
+            active=jnp.asarray(contact_mask),
         )
 
-        return a_ref, jnp.diag(R), K, D
+        # The vmap already stacks the per-point outputs, so flattening the
+        # leading axis replaces the previous concatenation of row sequences.
+        return a_ref.reshape(-1), R.reshape(-1), K.reshape(-1), D.reshape(-1)
@@ -390,7 +390,11 @@ class RigidContacts(ContactModel):
         sl = jnp.s_[:, 0:3, :]
         J_WC_lin = jnp.vstack(J_WC[sl])
 
-        delassus_matrix = J_WC_lin @ jnp.linalg.pinv(M) @ J_WC_lin.T
+        # The mass matrix is symmetric positive definite, so a Cholesky solve
+        # replaces the SVD-based pseudo-inverse.
+        delassus_matrix = J_WC_lin @ jax.scipy.linalg.cho_solve(
+            jax.scipy.linalg.cho_factor(M), J_WC_lin.T
+        )
         return delassus_matrix
 
     @staticmethod
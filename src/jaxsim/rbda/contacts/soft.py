@@ -414,16 +414,16 @@ class SoftContacts(common.ContactModel):
             q=parameters.q,
         )
 
-        # Pack a mixed 6D force.
-        CW_f = jnp.hstack([CW_fl, jnp.zeros(3)])
-
         # Compute the 6D force transform from the mixed to the inertial-fixed frame.
         W_Xf_CW = jaxsim.math.Adjoint.from_quaternion_and_translation(
             translation=jnp.array(position), inverse=True
         ).T
 
         # Compute the 6D force in the inertial-fixed frame.
-        W_f = W_Xf_CW @ CW_f
+        # The mixed 6D force has no angular component, so only the first three
+        # columns of the transform contribute and packing the full 6D force
+        # with jnp.hstack is not needed.
+        W_f = W_Xf_CW[:, 0:3] @ CW_fl
 
         return W_f, ṁ
 
@@ -606,8 +606,10 @@ class ViscoElasticContacts(common.ContactModel):
                 model=model, data=data, output_vel_repr=jaxsim.VelRepr.Mixed
             )[indices_of_enabled_collidable_points, 0:3, :]
 
-        # Compute the Delassus matrix.
-        ψ = jnp.vstack(CW_Jl_WC) @ jnp.linalg.lstsq(M, jnp.vstack(CW_Jl_WC).T)[0]
+        # Compute the Delassus matrix. The mass matrix is symmetric positive
+        # definite, so a Cholesky solve replaces the SVD-based lstsq.
+        Jl = jnp.vstack(CW_Jl_WC)
+        ψ = Jl @ jax.scipy.linalg.cho_solve(jax.scipy.linalg.cho_factor(M), Jl.T)
 
         I_nc = jnp.eye(v_t0.flatten().size)
         O_nc = jnp.zeros(shape=(p_t0.flatten().size, p_t0.flatten().size))
@@ -55,11 +55,18 @@ class Terrain(abc.ABC):
         h_yp = self.height(x=x, y=y + self.delta)
         h_ym = self.height(x=x, y=y - self.delta)
 
-        n = jnp.array(
-            [(h_xm - h_xp) / (2 * self.delta), (h_ym - h_yp) / (2 * self.delta), 1.0]
+        # Stack along the trailing axis so that batched (x, y) coordinates
+        # produce a matrix of stacked normals.
+        n = jnp.stack(
+            [
+                (h_xm - h_xp) / (2 * self.delta),
+                (h_ym - h_yp) / (2 * self.delta),
+                jnp.ones_like(jnp.asarray(h_xp, dtype=float)),
+            ],
+            axis=-1,
         )
 
-        return n / jaxsim.math.safe_norm(n)
+        return n / jaxsim.math.safe_norm(n, axis=-1)[..., jnp.newaxis]
 
 
 @jax_dataclasses.pytree_dataclass
@@ -96,7 +103,8 @@ class FlatTerrain(Terrain):
             The height of the terrain at the specified location.
         """
 
-        return jnp.array(self._height, dtype=float)
+        # Follow the shape of the query coordinates to support batched inputs.
+        return jnp.full_like(jnp.asarray(x, dtype=float), fill_value=self._height)
 
     def normal(self, x: jtp.FloatLike, y: jtp.FloatLike) -> jtp.Vector:
         """
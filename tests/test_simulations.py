@@ -418,6 +418,124 @@ def test_simulation_with_relaxed_rigid_contacts(
     )
 
 
+def test_relaxed_rigid_contacts_batched(
+    jaxsim_model_box: js.model.JaxSimModel,
+):
+
+    model = jaxsim_model_box
+
+    with model.editable(validate=False) as model:
+
+        model.contact_model = jaxsim.rbda.contacts.RelaxedRigidContacts.build()
+
+        # Enable a subset of the collidable points.
+        enabled_collidable_points_mask = np.zeros(
+            len(model.kin_dyn_parameters.contact_parameters.body), dtype=bool
+        )
+        enabled_collidable_points_mask[[0, 1, 2, 3]] = True
+        model.kin_dyn_parameters.contact_parameters.enabled = tuple(
+            enabled_collidable_points_mask.tolist()
+        )
+
+    # Check jaxsim_model_box@conftest.py.
+    box_height = 0.1
+
+    # Build a batch of data ranging from a configuration in contact with the
+    # terrain to one in free flight.
+    batch_of_data = jax.tree.map(
+        lambda *leaves: jnp.stack(leaves),
+        *(
+            js.data.JaxSimModelData.build(
+                model=model,
+                base_position=jnp.array([0.0, 0.0, z]),
+                base_linear_velocity=jnp.array([0.1, 0.0, -0.2]),
+                velocity_representation=VelRepr.Inertial,
+            )
+            for z in (0.8 * box_height / 2, 0.9 * box_height / 2, 2 * box_height)
+        ),
+    )
+
+    W_f_batch, _ = model.contact_model.compute_contact_forces_batched(
+        model=model, data=batch_of_data
+    )
+
+    # The batched entrypoint must match the per-sample computation.
+    for i in range(W_f_batch.shape[0]):
+
+        data_i = jax.tree.map(lambda leaf, i=i: leaf[i], batch_of_data)
+        W_f_i, _ = model.contact_model.compute_contact_forces(model=model, data=data_i)
+
+        assert W_f_batch[i] == pytest.approx(W_f_i)
+
+
+def test_relaxed_rigid_contacts_solve_in_float32(
+    jaxsim_model_box: js.model.JaxSimModel,
+):
+
+    model = jaxsim_model_box
+
+    with model.editable(validate=False) as model:
+
+        model.contact_model = jaxsim.rbda.contacts.RelaxedRigidContacts.build()
+
+        # Enable a subset of the collidable points.
+        enabled_collidable_points_mask = np.zeros(
+            len(model.kin_dyn_parameters.contact_parameters.body), dtype=bool
+        )
+        enabled_collidable_points_mask[[0, 1, 2, 3]] = True
+        model.kin_dyn_parameters.contact_parameters.enabled = tuple(
+            enabled_collidable_points_mask.tolist()
+        )
+
+    # Build a second model differing only in the precision of the linear solve.
+    with model.editable(validate=False) as model_f32:
+        model_f32.contact_model = jaxsim.rbda.contacts.RelaxedRigidContacts.build(
+            solve_in_float32=True
+        )
+
+    # Check jaxsim_model_box@conftest.py.
+    box_height = 0.1
+
+    def build_data(model: js.model.JaxSimModel, **kwargs) -> js.data.JaxSimModelData:
+
+        # Build the data of a box penetrating the terrain with a non-zero velocity.
+        return js.data.JaxSimModelData.build(
+            model=model,
+            base_position=jnp.array([0.0, 0.0, 0.8 * box_height / 2]),
+            base_linear_velocity=jnp.array([0.1, 0.0, -0.2]),
+            velocity_representation=VelRepr.Inertial,
+            **kwargs,
+        )
+
+    # The single-precision solve must stay close to the double-precision one.
+    W_f, _ = model.contact_model.compute_contact_forces(
+        model=model, data=build_data(model)
+    )
+    W_f_f32, _ = model_f32.contact_model.compute_contact_forces(
+        model=model_f32, data=build_data(model_f32)
+    )
+
+    assert jnp.isfinite(W_f_f32).all()
+    assert W_f_f32 == pytest.approx(W_f, rel=1e-4, abs=1e-3)
+
+    # With a zero friction coefficient the regularizer vanishes and the system
+    # becomes singular: the solve must remain finite also in single precision.
+    # The per-point forces are not unique in this case, so only the resulting
+    # net wrench is compared across precisions.
+    contacts_params = jaxsim.rbda.contacts.RelaxedRigidContactsParams.build(mu=0.0)
+
+    W_f, _ = model.contact_model.compute_contact_forces(
+        model=model, data=build_data(model, contacts_params=contacts_params)
+    )
+    W_f_f32, _ = model_f32.contact_model.compute_contact_forces(
+        model=model_f32, data=build_data(model_f32, contacts_params=contacts_params)
+    )
+
+    assert jnp.isfinite(W_f).all()
+    assert jnp.isfinite(W_f_f32).all()
+    assert W_f_f32.sum(axis=0) == pytest.approx(W_f.sum(axis=0), rel=1e-3, abs=1e-3)
+
+
 def test_joint_limits(
     jaxsim_model_single_pendulum: js.model.JaxSimModel,
 ):